@@ -1,10 +1,12 @@
 import streamlit as st
 import tempfile
+import hashlib
 import json
 import os
 from executor import execute_parser
 from llm_parser import parse_with_llm
-from difflib import SequenceMatcher
+from exporter import export_to_bytes, CODE_TRANSACTION_SCHEMA, LLM_TRANSACTION_SCHEMA, COMPARISON_SCHEMA
+from comparison import calculate_similarity, build_comparison_rows
 import re
 
 
@@ -22,37 +24,6 @@ def extract_json_from_response(response_text):
     return []
 
 
-def similarity(a, b):
-    return SequenceMatcher(None, str(a), str(b)).ratio()
-
-
-def calculate_similarity(trans1, trans2):
-    min_len = min(len(trans1), len(trans2))
-    scores = []
-
-    for i in range(min_len):
-
-        t1 = trans1[i]
-        t2 = trans2[i]
-
-        desc_sim = similarity(t1.get("details", ""), t2.get("details", ""))
-
-        date_match = 1 if t1.get("date") == t2.get("date") else 0
-
-        amt1 = t1.get("credit", 0) if t1.get("credit", 0) != 0 else t1.get("debit", 0)
-        amt2 = t2.get("amount", 0)
-        amount_match = 1 if float(amt1) == float(amt2) else 0
-
-        balance_match = 1 if float(t1.get("balance", 0)) == float(t2.get("balance", 0)) else 0
-
-        total = (date_match + amount_match + balance_match + desc_sim) / 4
-        scores.append(total)
-
-    if scores:
-        return round((sum(scores) / len(scores)) * 100, 2)
-    return 0
-
-
 # ----------------------------
 # UI
 # ----------------------------
@@ -64,76 +35,121 @@ if uploaded_file:
 
     password = st.text_input("Enter PDF Password (if any)", type="password")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        tmp_file.write(uploaded_file.read())
-        pdf_path = tmp_file.name
+    pdf_bytes = uploaded_file.getvalue()
+
+    # Results are only reused for the same statement content and password
+    run_key = hashlib.sha256(pdf_bytes + password.encode("utf-8")).hexdigest()
 
     if st.button("Run Validation"):
 
+        # Drop the previous run's PDF copy before writing a new one
+        previous = st.session_state.pop("validation", None)
+        if previous and os.path.exists(previous["pdf_path"]):
+            os.remove(previous["pdf_path"])
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+            tmp_file.write(pdf_bytes)
+            pdf_path = tmp_file.name
+
         # ----------------------------
         # Select Active Parser
         # ----------------------------
         if os.path.exists("manual_override_parser.py"):
-            st.info("🔁 Using Manual Override Parser")
             parser_file = "manual_override_parser.py"
         else:
-            st.info("⚙ Using Generated Parser")
             parser_file = "generated_parser.py"
 
         # ----------------------------
         # Run Code Parser
         # ----------------------------
         code_transactions = execute_parser(pdf_path, parser_file, password)
-        st.success(f"Code Parser Transactions: {len(code_transactions)}")
 
         # ----------------------------
         # Run LLM Direct Extraction
         # ----------------------------
         llm_response = parse_with_llm(pdf_path, password)
         llm_transactions = extract_json_from_response(llm_response)
-        st.success(f"LLM Transactions: {len(llm_transactions)}")
-
-        # ----------------------------
-        # Side-by-Side Comparison
-        # ----------------------------
-        st.subheader("Side-by-Side Comparison")
-
-        min_len = min(len(code_transactions), len(llm_transactions))
-        transaction_scores = []
 
-        for i in range(min_len):
+        comparison_rows, transaction_scores = build_comparison_rows(code_transactions, llm_transactions)
 
-            col1, col2 = st.columns(2)
+        # Kept in session state so paging and downloads survive reruns
+        st.session_state["validation"] = {
+            "run_key": run_key,
+            "pdf_path": pdf_path,
+            "parser_file": parser_file,
+            "code_transactions": code_transactions,
+            "llm_transactions": llm_transactions,
+            "comparison_rows": comparison_rows,
+            "transaction_scores": transaction_scores,
+            "exports": {},
+        }
 
-            with col1:
-                st.markdown(f"### Code Parser - Transaction {i+1}")
-                st.json(code_transactions[i])
+    validation = st.session_state.get("validation")
 
-            with col2:
-                st.markdown(f"### LLM Parser - Transaction {i+1}")
-                st.json(llm_transactions[i])
+    if validation and validation["run_key"] == run_key:
 
-            # Transaction Similarity
-            desc_sim = similarity(
-                code_transactions[i].get("details", ""),
-                llm_transactions[i].get("details", "")
-            )
-
-            date_match = 1 if code_transactions[i].get("date") == llm_transactions[i].get("date") else 0
-
-            amt1 = code_transactions[i].get("credit", 0) if code_transactions[i].get("credit", 0) != 0 else code_transactions[i].get("debit", 0)
-            amt2 = llm_transactions[i].get("amount", 0)
-            amount_match = 1 if float(amt1) == float(amt2) else 0
+        pdf_path = validation["pdf_path"]
+        code_transactions = validation["code_transactions"]
+        llm_transactions = validation["llm_transactions"]
+        comparison_rows = validation["comparison_rows"]
+        transaction_scores = validation["transaction_scores"]
 
-            balance_match = 1 if float(code_transactions[i].get("balance", 0)) == float(llm_transactions[i].get("balance", 0)) else 0
+        if validation["parser_file"] == "manual_override_parser.py":
+            st.info("🔁 Using Manual Override Parser")
+        else:
+            st.info("⚙ Using Generated Parser")
 
-            total = (date_match + amount_match + balance_match + desc_sim) / 4
-            percent = round(total * 100, 2)
+        st.success(f"Code Parser Transactions: {len(code_transactions)}")
+        st.success(f"LLM Transactions: {len(llm_transactions)}")
 
-            transaction_scores.append(total)
+        # ----------------------------
+        # Side-by-Side Comparison
+        # ----------------------------
+        st.subheader("Side-by-Side Comparison")
 
-            st.info(f"Transaction Similarity: {percent}%")
-            st.divider()
+        # One virtualized table per page instead of a widget pair per row
+        page_size = st.selectbox("Rows per page", [100, 500, 1000], index=1)
+        page_count = max(1, -(-len(comparison_rows) // page_size))
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+
+        start = (page - 1) * page_size
+        st.dataframe(comparison_rows[start:start + page_size], use_container_width=True, hide_index=True)
+        st.caption(f"Showing {min(start + 1, len(comparison_rows))}–{min(start + page_size, len(comparison_rows))} of {len(comparison_rows)}")
+
+        export_col1, export_col2 = st.columns(2)
+        with export_col1:
+            export_name = st.selectbox("Export data", ["comparison", "code_transactions", "llm_transactions"])
+        with export_col2:
+            export_format = st.selectbox("Export format", ["csv", "jsonl", "parquet"])
+
+        exports = {
+            "comparison": (comparison_rows, COMPARISON_SCHEMA),
+            "code_transactions": (code_transactions, CODE_TRANSACTION_SCHEMA),
+            # Raw model output is untrusted, so JSONL passes it through unchecked
+            "llm_transactions": (llm_transactions, None if export_format == "jsonl" else LLM_TRANSACTION_SCHEMA),
+        }
+
+        # Serialise each (dataset, format) once per run, not on every rerun
+        export_cache = validation["exports"]
+        export_key = (export_name, export_format)
+
+        if export_key not in export_cache:
+            rows, schema = exports[export_name]
+            try:
+                export_cache[export_key] = export_to_bytes(rows, export_format, schema)
+            except Exception as e:
+                export_cache[export_key] = e
+
+        export_data = export_cache[export_key]
+
+        if isinstance(export_data, Exception):
+            st.error(f"Export Error: {export_data}")
+        else:
+            st.download_button(
+                "Download",
+                data=export_data,
+                file_name=f"{export_name}.{export_format}",
+            )
 
         # ----------------------------
         # Overall Similarity
@@ -0,0 +1,79 @@
+from difflib import SequenceMatcher
+
+
+# ----------------------------
+# Helper Functions
+# ----------------------------
+def similarity(a, b):
+    return SequenceMatcher(None, str(a), str(b)).ratio()
+
+
+def code_amount(txn):
+    # Code parser rows carry either a credit or a debit
+    amount = txn.get("credit", 0) if txn.get("credit", 0) != 0 else txn.get("debit", 0)
+    return float(amount)
+
+
+def llm_amount(txn):
+    return float(txn.get("amount", 0))
+
+
+def balance(txn):
+    return float(txn.get("balance", 0))
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+# ----------------------------
+# Scoring
+# ----------------------------
+def transaction_similarity(t1, t2):
+    desc_sim = similarity(t1.get("details", ""), t2.get("details", ""))
+
+    date_match = 1 if t1.get("date") == t2.get("date") else 0
+
+    amount_match = 1 if code_amount(t1) == llm_amount(t2) else 0
+
+    balance_match = 1 if balance(t1) == balance(t2) else 0
+
+    return (date_match + amount_match + balance_match + desc_sim) / 4
+
+
+def calculate_similarity(trans1, trans2):
+    scores = [transaction_similarity(t1, t2) for t1, t2 in zip(trans1, trans2)]
+
+    if scores:
+        return round((sum(scores) / len(scores)) * 100, 2)
+    return 0
+
+
+def build_comparison_rows(code_transactions, llm_transactions):
+    """Flatten paired transactions into table rows plus their raw scores.
+
+    Amounts and balances are the same floats the score is computed from,
+    so every row matches COMPARISON_SCHEMA.
+    """
+
+    rows = []
+    scores = []
+
+    for i, (code, llm) in enumerate(zip(code_transactions, llm_transactions)):
+        score = transaction_similarity(code, llm)
+        scores.append(score)
+
+        rows.append({
+            "#": i + 1,
+            "code_date": _text(code.get("date")),
+            "code_details": _text(code.get("details")),
+            "code_amount": code_amount(code),
+            "code_balance": balance(code),
+            "llm_date": _text(llm.get("date")),
+            "llm_details": _text(llm.get("details")),
+            "llm_amount": llm_amount(llm),
+            "llm_balance": balance(llm),
+            "similarity": round(score * 100, 2),
+        })
+
+    return rows, scores
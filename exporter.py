@@ -0,0 +1,206 @@
+import csv
+import io
+import json
+from contextlib import contextmanager
+from itertools import islice
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# ==========================================================
+# CONFIGURATION
+# ==========================================================
+BATCH_SIZE = 1000
+
+# Field name -> Python type. Every field is nullable.
+CODE_TRANSACTION_SCHEMA = {
+    "date": str,
+    "details": str,
+    "debit": float,
+    "credit": float,
+    "balance": float,
+    "confidence": float,
+}
+
+LLM_TRANSACTION_SCHEMA = {
+    "date": str,
+    "details": str,
+    "type": str,
+    "amount": float,
+    "balance": float,
+    "confidence": float,
+}
+
+COMPARISON_SCHEMA = {
+    "#": int,
+    "code_date": str,
+    "code_details": str,
+    "code_amount": float,
+    "code_balance": float,
+    "llm_date": str,
+    "llm_details": str,
+    "llm_amount": float,
+    "llm_balance": float,
+    "similarity": float,
+}
+
+ARROW_TYPES = {
+    str: pa.string(),
+    float: pa.float64(),
+    int: pa.int64(),
+}
+
+
+# ==========================================================
+# HELPERS
+# ==========================================================
+def iter_batches(transactions, batch_size=BATCH_SIZE):
+    """Yield lists of at most batch_size transactions from any iterable."""
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    iterator = iter(transactions)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def normalise_row(row, schema):
+    """Return row with exactly the schema's fields, or raise ValueError.
+
+    Missing fields become None. Ints are widened to float where the
+    schema asks for float; any other type mismatch is an error.
+    """
+
+    unknown = set(row) - set(schema)
+    if unknown:
+        raise ValueError(f"Unexpected fields: {sorted(unknown)}")
+
+    normalised = {}
+    for field, field_type in schema.items():
+        value = row.get(field)
+
+        if value is None:
+            normalised[field] = None
+        elif isinstance(value, bool):
+            raise ValueError(f"Field {field!r} expects {field_type.__name__}, got bool")
+        elif field_type is float and isinstance(value, int):
+            normalised[field] = float(value)
+        elif isinstance(value, field_type):
+            normalised[field] = value
+        else:
+            raise ValueError(
+                f"Field {field!r} expects {field_type.__name__}, got {type(value).__name__}: {value!r}"
+            )
+
+    return normalised
+
+
+def _iter_rows(transactions, schema):
+    if schema is None:
+        yield from transactions
+        return
+
+    for i, row in enumerate(transactions):
+        try:
+            yield normalise_row(row, schema)
+        except ValueError as e:
+            raise ValueError(f"Row {i + 1}: {e}") from e
+
+
+@contextmanager
+def _open_output(out, mode, **kwargs):
+    # Accept either a filesystem path or an already open file object
+    if isinstance(out, str):
+        with open(out, mode, **kwargs) as f:
+            yield f
+    else:
+        yield out
+
+
+# ==========================================================
+# WRITERS
+# ==========================================================
+def write_jsonl(transactions, out, schema=None, batch_size=BATCH_SIZE):
+    """Write one JSON object per line. Returns the number of rows written."""
+
+    count = 0
+    with _open_output(out, "w", encoding="utf-8", newline="") as f:
+        for batch in iter_batches(_iter_rows(transactions, schema), batch_size):
+            f.write("".join(json.dumps(txn, ensure_ascii=False) + "\n" for txn in batch))
+            count += len(batch)
+    return count
+
+
+def write_csv(transactions, out, schema=None, batch_size=BATCH_SIZE):
+    """Write transactions as CSV. Returns the number of rows written.
+
+    The header comes from schema, or from the keys of the first transaction.
+    A row with fields outside the header raises ValueError.
+    """
+
+    count = 0
+    writer = None
+    with _open_output(out, "w", encoding="utf-8", newline="") as f:
+        if schema is not None:
+            writer = csv.DictWriter(f, fieldnames=list(schema))
+            writer.writeheader()
+
+        for batch in iter_batches(_iter_rows(transactions, schema), batch_size):
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(batch[0]))
+                writer.writeheader()
+            writer.writerows(batch)
+            count += len(batch)
+    return count
+
+
+def write_parquet(transactions, out, schema=None, batch_size=BATCH_SIZE):
+    """Write transactions as Parquet, one row group per batch. Returns the number of rows written."""
+
+    if schema is None:
+        raise ValueError("Parquet export requires a schema")
+
+    arrow_schema = pa.schema([(field, ARROW_TYPES[field_type]) for field, field_type in schema.items()])
+
+    count = 0
+    with pq.ParquetWriter(out, arrow_schema) as writer:
+        for batch in iter_batches(_iter_rows(transactions, schema), batch_size):
+            writer.write_table(pa.Table.from_pylist(batch, schema=arrow_schema))
+            count += len(batch)
+
+        if count == 0:
+            writer.write_table(arrow_schema.empty_table())
+    return count
+
+
+WRITERS = {
+    "jsonl": write_jsonl,
+    "csv": write_csv,
+    "parquet": write_parquet,
+}
+
+
+def export_transactions(transactions, out, fmt, schema=None, batch_size=BATCH_SIZE):
+    """Dispatch to the writer for fmt ("jsonl", "csv" or "parquet")."""
+
+    if fmt not in WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    return WRITERS[fmt](transactions, out, schema=schema, batch_size=batch_size)
+
+
+def export_to_bytes(transactions, fmt, schema=None, batch_size=BATCH_SIZE):
+    """Export into memory, e.g. for a download button."""
+
+    if fmt == "parquet":
+        buffer = io.BytesIO()
+        export_transactions(transactions, buffer, fmt, schema, batch_size)
+        return buffer.getvalue()
+
+    buffer = io.StringIO()
+    export_transactions(transactions, buffer, fmt, schema, batch_size)
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,58 @@
+import csv
+import io
+
+import pytest
+
+from comparison import build_comparison_rows, calculate_similarity
+from exporter import COMPARISON_SCHEMA, export_to_bytes
+
+
+CODE_ROW = {
+    "date": "01/01/2024",
+    "details": "UPI payment",
+    "debit": 0.0,
+    "credit": 1200.0,
+    "balance": 5000.0,
+    "confidence": 1.0,
+}
+
+LLM_ROW = {
+    "date": "01/01/2024",
+    "details": "UPI payment",
+    "type": "CREDIT",
+    "amount": "1200.00",
+    "balance": "5000",
+    "confidence": 0.9,
+}
+
+
+def test_rows_use_scored_floats():
+    rows, scores = build_comparison_rows([CODE_ROW], [LLM_ROW])
+
+    assert rows[0]["llm_amount"] == 1200.0
+    assert rows[0]["llm_balance"] == 5000.0
+    assert rows[0]["code_amount"] == 1200.0
+    assert scores == [1.0]
+
+
+def test_debit_used_when_no_credit():
+    code = dict(CODE_ROW, debit=300, credit=0)
+    rows, _ = build_comparison_rows([code], [dict(LLM_ROW, amount=300)])
+    assert rows[0]["code_amount"] == 300.0
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv", "parquet"])
+def test_string_amounts_export(fmt):
+    rows, _ = build_comparison_rows([CODE_ROW], [LLM_ROW])
+    assert export_to_bytes(rows, fmt, COMPARISON_SCHEMA)
+
+
+def test_csv_export_values():
+    rows, _ = build_comparison_rows([CODE_ROW], [LLM_ROW])
+    parsed = list(csv.DictReader(io.StringIO(export_to_bytes(rows, "csv", COMPARISON_SCHEMA).decode("utf-8"))))
+    assert parsed[0]["llm_amount"] == "1200.0"
+
+
+def test_calculate_similarity_matches_rows():
+    assert calculate_similarity([CODE_ROW], [LLM_ROW]) == 100.0
+    assert calculate_similarity([], []) == 0
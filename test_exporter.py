@@ -0,0 +1,169 @@
+import csv
+import io
+import json
+
+import pyarrow.parquet as pq
+import pytest
+
+from exporter import (
+    CODE_TRANSACTION_SCHEMA,
+    LLM_TRANSACTION_SCHEMA,
+    export_to_bytes,
+    export_transactions,
+    iter_batches,
+)
+
+
+def make_transactions(n):
+    return [
+        {
+            "date": f"{i + 1:02d}/01/2024",
+            "details": f"UPI, payment {i}",
+            "debit": 0.0,
+            "credit": float(i),
+            "balance": float(i * 10),
+            "confidence": 1.0,
+        }
+        for i in range(n)
+    ]
+
+
+def read_csv(data):
+    return list(csv.DictReader(io.StringIO(data.decode("utf-8"))))
+
+
+def read_jsonl(data):
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+def read_parquet(data):
+    return pq.read_table(io.BytesIO(data))
+
+
+# ----------------------------
+# Batching
+# ----------------------------
+@pytest.mark.parametrize("n, expected", [(0, []), (3, [3]), (4, [3, 1]), (6, [3, 3])])
+def test_iter_batches_boundaries(n, expected):
+    assert [len(batch) for batch in iter_batches(range(n), 3)] == expected
+
+
+def test_iter_batches_rejects_zero():
+    with pytest.raises(ValueError):
+        list(iter_batches([1], 0))
+
+
+# ----------------------------
+# Round trips
+# ----------------------------
+@pytest.mark.parametrize("n", [2, 3])
+def test_jsonl_round_trip(n):
+    rows = make_transactions(n)
+    data = export_to_bytes(rows, "jsonl", CODE_TRANSACTION_SCHEMA, batch_size=2)
+    assert read_jsonl(data) == rows
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_csv_round_trip(n):
+    rows = make_transactions(n)
+    data = export_to_bytes(rows, "csv", CODE_TRANSACTION_SCHEMA, batch_size=2)
+    parsed = read_csv(data)
+    assert [row["details"] for row in parsed] == [row["details"] for row in rows]
+    assert [float(row["balance"]) for row in parsed] == [row["balance"] for row in rows]
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_parquet_round_trip(n):
+    rows = make_transactions(n)
+    data = export_to_bytes(rows, "parquet", CODE_TRANSACTION_SCHEMA, batch_size=2)
+    table = read_parquet(data)
+    assert table.to_pylist() == rows
+    assert pq.ParquetFile(io.BytesIO(data)).num_row_groups == -(-n // 2)
+
+
+# ----------------------------
+# Schema drift
+# ----------------------------
+def test_parquet_keeps_float_after_whole_numbers():
+    rows = [{"amount": 1}, {"amount": 1}, {"amount": 2.5}]
+    data = export_to_bytes(rows, "parquet", LLM_TRANSACTION_SCHEMA, batch_size=2)
+    assert read_parquet(data).column("amount").to_pylist() == [1.0, 1.0, 2.5]
+
+
+def test_parquet_accepts_values_after_null_batch():
+    rows = [{"balance": None}, {"balance": None}, {"balance": 5.0}]
+    data = export_to_bytes(rows, "parquet", LLM_TRANSACTION_SCHEMA, batch_size=2)
+    assert read_parquet(data).column("balance").to_pylist() == [None, None, 5.0]
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv", "parquet"])
+def test_string_amount_fails_loudly(fmt):
+    rows = [{"amount": 1.0}, {"amount": 2.0}, {"amount": "1,200.00"}]
+    with pytest.raises(ValueError):
+        export_to_bytes(rows, fmt, LLM_TRANSACTION_SCHEMA, batch_size=2)
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv", "parquet"])
+def test_unknown_field_fails_loudly(fmt):
+    rows = [{"date": "a"}, {"date": "b"}, {"date": "c", "extra": 9}]
+    with pytest.raises(ValueError):
+        export_to_bytes(rows, fmt, LLM_TRANSACTION_SCHEMA, batch_size=2)
+
+
+def test_csv_keeps_fields_missing_from_first_row():
+    rows = [{"date": "a", "amount": 1}, {"date": "b", "amount": 2, "balance": 5}]
+    parsed = read_csv(export_to_bytes(rows, "csv", LLM_TRANSACTION_SCHEMA))
+    assert parsed[1]["balance"] == "5.0"
+
+
+def test_csv_without_schema_rejects_drift():
+    rows = [{"date": "a"}, {"date": "b", "balance": 5}]
+    with pytest.raises(ValueError):
+        export_to_bytes(rows, "csv")
+
+
+def test_parquet_requires_schema():
+    with pytest.raises(ValueError):
+        export_to_bytes(make_transactions(1), "parquet")
+
+
+# ----------------------------
+# Empty input
+# ----------------------------
+def test_empty_csv_has_header():
+    data = export_to_bytes([], "csv", CODE_TRANSACTION_SCHEMA)
+    assert data.decode("utf-8").strip() == ",".join(CODE_TRANSACTION_SCHEMA)
+
+
+def test_empty_parquet_is_valid():
+    table = read_parquet(export_to_bytes([], "parquet", CODE_TRANSACTION_SCHEMA))
+    assert table.num_rows == 0
+    assert table.schema.names == list(CODE_TRANSACTION_SCHEMA)
+
+
+def test_empty_parquet_creates_file(tmp_path):
+    path = str(tmp_path / "empty.parquet")
+    assert export_transactions([], path, "parquet", CODE_TRANSACTION_SCHEMA) == 0
+    assert pq.read_table(path).num_rows == 0
+
+
+# ----------------------------
+# Dispatch
+# ----------------------------
+def test_unknown_format_rejected():
+    with pytest.raises(ValueError):
+        export_to_bytes([], "xlsx")
+
+
+# ----------------------------
+# Error reporting
+# ----------------------------
+def test_error_names_row_and_field():
+    rows = [{"amount": 1.0}, {"amount": "abc"}]
+    with pytest.raises(ValueError, match=r"Row 2: Field 'amount'"):
+        export_to_bytes(rows, "csv", LLM_TRANSACTION_SCHEMA)
+
+
+def test_jsonl_without_schema_passes_rows_through():
+    rows = [{"amount": "1,200.00", "extra": True}]
+    assert read_jsonl(export_to_bytes(rows, "jsonl")) == rows